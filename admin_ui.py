@@ -1,5 +1,5 @@
 import streamlit as st
-import requests
+import httpx
 import pandas as pd
 from datetime import datetime
 
@@ -7,6 +7,17 @@ from datetime import datetime
 st.set_page_config(layout="wide", page_title="FinLit Admin")
 BACKEND_URL = "http://localhost:8000"  # URL of your FastAPI backend
 
+# --- Shared HTTP Client ---
+# Cached across Streamlit reruns so repeated backend calls (health check,
+# upload, clear) reuse pooled keep-alive connections instead of opening a
+# new one every time.
+@st.cache_resource
+def get_http():
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        timeout=300
+    )
+
 # --- Initialize Session State ---
 # This is used to store the list of uploaded documents, just like the React state
 if "documents" not in st.session_state:
@@ -66,7 +77,7 @@ with tab_upload:
                 progress_bar.progress(30, text="Sending files to backend...")
                 
                 # Replicates the documentService.js API call
-                response = requests.post(
+                response = get_http().post(
                     f"{BACKEND_URL}/api/v1/chatbot/documents/upload-multiple",
                     files=files_to_send,
                     data=data,
@@ -100,7 +111,7 @@ with tab_upload:
                     st.error(f"Upload failed: {response.json().get('detail', 'Unknown error')}")
                     progress_bar.progress(100, text="Upload failed.")
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 st.error(f"Connection error: {e}")
                 progress_bar.progress(100, text="Connection error.")
 
@@ -131,13 +142,13 @@ with tab_admin:
     if st.button("Run Health Check"):
         try:
             # Replicates the checkHealth API call
-            response = requests.get(f"{BACKEND_URL}/health", timeout=10)
+            response = get_http().get(f"{BACKEND_URL}/health", timeout=10)
             if response.status_code == 200:
                 st.success("Backend service is healthy!")
                 st.json(response.json())
             else:
                 st.error(f"Health check failed. Status code: {response.status_code}")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             st.error(f"Health check failed: Unable to connect to backend. {e}")
 
     st.divider()
@@ -155,7 +166,7 @@ with tab_admin:
         with st.spinner("Attempting to clear all documents..."):
             try:
                 params = {"admin_key": admin_key}
-                response = requests.delete(
+                response = get_http().delete(
                     f"{BACKEND_URL}/api/v1/chatbot/documents/clear-all",
                     params=params,
                     timeout=60
@@ -170,5 +181,5 @@ with tab_admin:
                 else:
                     st.error(f"Failed to clear database: {response.json().get('detail', 'Unknown error')}")
             
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 st.error(f"Connection error: {e}")
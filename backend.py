@@ -1,20 +1,28 @@
 import uvicorn
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import json
 import logging
+import os
+import uuid
+
+import numpy as np
+from cachetools import TTLCache
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
-import io
 import datetime
 
 # Document Parsers
-import pypdf
+import fitz  # PyMuPDF
 import docx
 import openpyxl
 
 # LangChain Components
-from langchain_ollama import OllamaLLM as Ollama 
-from langchain_ollama import OllamaEmbeddings 
-from langchain_redis import RedisVectorStore as Redis 
+from langchain_ollama import OllamaLLM as Ollama
+from langchain_ollama import OllamaEmbeddings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -32,10 +40,24 @@ from urllib3.exceptions import NotOpenSSLWarning
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warms the Ollama models before traffic is accepted, so the first real
+    chat request doesn't pay the multi-second model cold-start cost.
+    """
+    if chat_model and redis_client:
+        logger.info("Warming up Ollama models...")
+        await asyncio.to_thread(embeddings.embed_query, "warmup")
+        await asyncio.to_thread(chat_model.invoke, "hi")
+        logger.info("Ollama models warmed up.")
+    yield
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Financial Literacy Chatbot API",
-    description="API for RAG chatbot and document management."
+    description="API for RAG chatbot and document management.",
+    lifespan=lifespan
 )
 
 # --- Data Models ---
@@ -65,6 +87,55 @@ class ClearResponse(BaseModel):
     success: bool
     message: str
 
+# --- Vector Index ---
+
+# Dimensionality of nomic-embed-text vectors
+VECTOR_DIM = 768
+
+def ensure_vector_index():
+    """
+    Creates the INT8 vector index if it does not already exist. Safe to
+    call concurrently from multiple workers: if another process creates
+    the index between the FT.INFO check and our FT.CREATE, the resulting
+    "already exists" error is treated as success.
+    """
+    try:
+        redis_client.execute_command("FT.INFO", INDEX_NAME)
+        return
+    except redis.exceptions.ResponseError:
+        pass
+    try:
+        redis_client.execute_command(
+            "FT.CREATE", INDEX_NAME, "ON", "HASH",
+            "PREFIX", "1", f"{INDEX_NAME}:",
+            "SCHEMA",
+            "text", "TEXT",
+            "embedding", "VECTOR", "FLAT", "6",
+            "TYPE", "INT8", "DIM", str(VECTOR_DIM), "DISTANCE_METRIC", "COSINE",
+        )
+    except redis.exceptions.ResponseError as e:
+        if "already exists" not in str(e).lower():
+            # Most common cause: Redis too old for INT8 vectors. Log it
+            # distinctly so it isn't mistaken for Ollama being down.
+            logger.error(
+                f"Failed to create vector index '{INDEX_NAME}': {e}. "
+                "INT8 vector fields require Redis 8 (RediSearch 2.10+)."
+            )
+            raise
+
+def quantize_vector(vector: List[float]):
+    """
+    Quantizes an FP32 embedding to int8 with a per-vector scale, cutting
+    vector RAM and KNN bandwidth 4x. The scale is stored alongside the
+    blob so the original values can be reconstructed if needed; cosine
+    distance itself is scale-invariant.
+    """
+    arr = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(arr).max()) / 127.0
+    if scale == 0.0:
+        scale = 1.0
+    return np.round(arr / scale).astype(np.int8).tobytes(), scale
+
 try:
     # Initialize Ollama embeddings
     embeddings = OllamaEmbeddings(model="nomic-embed-text")
@@ -72,19 +143,16 @@ try:
     # Initialize Ollama chat model
     chat_model = Ollama(model="phi3:mini")
 
-    # Initialize Redis vector store
+    # Redis connection and the INT8 vector index
     REDIS_URL = "redis://localhost:6379"
     INDEX_NAME = "financial_literacy_docs"
-    
-   
-    vectorstore = Redis(
-        redis_url=REDIS_URL,
-        index_name=INDEX_NAME,
-        embeddings=embeddings 
-    )
-    
-    # Direct Redis client for admin tasks
+
+    # Bumped on clear-all so every worker drops its retrieval cache; the
+    # key deliberately avoids the index's "financial_literacy_docs:" prefix
+    CACHE_GENERATION_KEY = f"{INDEX_NAME}_cache_generation"
+
     redis_client = redis.from_url(REDIS_URL)
+    ensure_vector_index()
 
     # Text Splitter (matches Java config)
     text_splitter = RecursiveCharacterTextSplitter(
@@ -96,59 +164,273 @@ try:
     SYSTEM_PROMPT = """
         You are a financial assistant. Provide concise, helpful answers using the context below.
         Keep responses under 150 words for mobile users.
-        
+
         CONTEXT:
         {documents}
         """
 
+    # Hot-path RAG objects, built once at startup instead of per request
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PROMPT),
+        ("human", "{query}")
+    ])
+    chain = prompt_template | chat_model | StrOutputParser()
+
 except Exception as e:
     logger.error(f"Failed to initialize global components: {e}", exc_info=True)
     # In a real app, you might want to prevent startup
-    vectorstore = None
     chat_model = None
     redis_client = None
+    chain = None
 
 # --- Dependency Check ---
 
 def get_services():
-    if not vectorstore or not chat_model or not redis_client:
+    if not chat_model or not redis_client:
         raise HTTPException(
-            status_code=503, 
+            status_code=503,
             detail="Core services (Ollama/Redis) are not available."
         )
-    return vectorstore, chat_model, redis_client
+    return chat_model, redis_client
 
 # --- Document Processing Logic (from DocumentProcessingService.java) ---
 
-def parse_pdf(contents: bytes) -> str:
-    logger.info("Parsing PDF content")
-    reader = pypdf.PdfReader(io.BytesIO(contents))
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() or ""
-    return text
+# How many threads extract pages of a single PDF in parallel; fitz releases
+# the GIL inside its C extension, so this scales with cores
+PDF_PAGE_WORKERS = 8
 
-def parse_docx(contents: bytes) -> str:
+def _extract_pdf_pages(contents: bytes, pages: range) -> List[str]:
+    # PyMuPDF documents aren't thread-safe, so each worker opens its own
+    # document over the shared bytes
+    doc = fitz.open(stream=contents, filetype="pdf")
+    return [doc.load_page(i).get_text("text") for i in pages]
+
+def parse_pdf(fileobj) -> str:
+    logger.info("Parsing PDF content")
+    # fitz needs a bytes buffer; read from the spooled file in the worker thread
+    contents = fileobj.read()
+    doc = fitz.open(stream=contents, filetype="pdf")
+    page_count = doc.page_count
+
+    # Small documents aren't worth the thread fan-out
+    if page_count <= PDF_PAGE_WORKERS:
+        return "\n".join(page.get_text("text") for page in doc)
+    doc.close()
+
+    step = -(-page_count // PDF_PAGE_WORKERS)  # ceil division
+    ranges = [
+        range(start, min(start + step, page_count))
+        for start in range(0, page_count, step)
+    ]
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        results = executor.map(lambda pages: _extract_pdf_pages(contents, pages), ranges)
+    return "\n".join(text for pages in results for text in pages)
+
+def parse_docx(fileobj) -> str:
     logger.info("Parsing DOCX content")
-    doc = docx.Document(io.BytesIO(contents))
-    text = ""
-    for para in doc.paragraphs:
-        text += para.text + "\n"
-    return text
+    doc = docx.Document(fileobj)
+    return "\n".join(para.text for para in doc.paragraphs)
 
-def parse_xlsx(contents: bytes) -> str:
+def parse_xlsx(fileobj) -> str:
     logger.info("Parsing XLSX content")
-    wb = openpyxl.load_workbook(io.BytesIO(contents))
-    text = ""
+    wb = openpyxl.load_workbook(fileobj, read_only=True, data_only=True)
+    parts = []
     for sheet_name in wb.sheetnames:
         sheet = wb[sheet_name]
-        text += f"Sheet: {sheet_name}\n"
-        for row in sheet.iter_rows():
-            row_values = [str(cell.value) for cell in row if cell.value is not None]
+        parts.append(f"Sheet: {sheet_name}")
+        # values_only avoids allocating a Cell object per cell
+        for row in sheet.iter_rows(values_only=True):
+            row_values = [str(value) for value in row if value is not None]
             if row_values:
-                text += " | ".join(row_values) + "\n"
-        text += "\n"
-    return text
+                parts.append(" | ".join(row_values))
+        parts.append("")
+    return "\n".join(parts)
+
+PARSERS = {
+    "application/pdf": parse_pdf,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": parse_docx, # .docx
+    "application/msword": parse_docx, # .doc
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": parse_xlsx, # .xlsx
+    "application/vnd.ms-excel": parse_xlsx # .xls
+}
+
+# How many files are parsed concurrently per upload request
+UPLOAD_CONCURRENCY = 8
+
+# How many chunks are sent to Ollama per embedding call (50-250 is the sweet spot)
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "128"))
+
+# How many HSET commands are queued on the pipeline before a flush
+REDIS_PIPELINE_SIZE = 1000
+
+def add_documents_batched(docs: List[LangChainDocument]):
+    """
+    Embeds documents in large batches and writes the vectors to Redis directly.
+    RedisVectorStore.add_documents embeds chunk-by-chunk; batching the
+    embed_documents calls cuts the number of HTTP round-trips to Ollama,
+    and queuing the HSETs on a pipeline collapses the per-chunk Redis
+    round-trips into one per REDIS_PIPELINE_SIZE commands.
+    """
+    pipe = redis_client.pipeline(transaction=False)
+    pending = 0
+    for start in range(0, len(docs), EMBED_BATCH_SIZE):
+        batch = docs[start:start + EMBED_BATCH_SIZE]
+        vectors = embeddings.embed_documents([doc.page_content for doc in batch])
+        # One contiguous float32 array per batch; quantizing a row is then a
+        # cheap numpy view instead of a per-element list-of-floats conversion
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        for doc, vector in zip(batch, vectors):
+            key = f"{INDEX_NAME}:{uuid.uuid4().hex}"
+            blob, scale = quantize_vector(vector)
+            mapping = {
+                "text": doc.page_content,
+                "embedding": blob,
+                "embedding_scale": scale,
+            }
+            mapping.update({k: str(v) for k, v in doc.metadata.items()})
+            pipe.hset(key, mapping=mapping)
+            pending += 1
+            if pending >= REDIS_PIPELINE_SIZE:
+                pipe.execute()
+                pending = 0
+    if pending:
+        pipe.execute()
+
+def process_file(fileobj, filename: str, content_type: str, user_id: str) -> List[LangChainDocument]:
+    """
+    Parses a single file, splits it into chunks, and returns the resulting
+    LangChain documents. Runs in a worker thread so the CPU-bound parsers
+    don't block the event loop. Takes the upload's spooled temporary file
+    directly, so large documents are never fully buffered a second time.
+    """
+    parser = PARSERS[content_type]
+
+    # 1. Extract text
+    extracted_text = parser(fileobj)
+    if not extracted_text or extracted_text.isspace():
+        logger.warning(f"No text extracted from file: {filename}")
+        return []
+
+    # 2. Split text into chunks
+    chunks = text_splitter.split_text(extracted_text)
+
+    # 3. Create LangChain Documents with metadata; the invariant fields are
+    # built once per file rather than once per chunk
+    base_metadata = {
+        "fileName": filename,
+        "fileType": content_type,
+        "userId": user_id,
+        "totalChunks": len(chunks),
+        "category": "financial_literacy",
+        "uploadTimestamp": datetime.datetime.now().isoformat()
+    }
+    return [
+        LangChainDocument(page_content=chunk, metadata={**base_metadata, "chunkIndex": i})
+        for i, chunk in enumerate(chunks)
+    ]
+
+# --- Query Batching ---
+
+# Coalesce concurrent retrievals: flush once this many queries are pending
+# or the window elapses, whichever comes first.
+QUERY_BATCH_SIZE = 16
+QUERY_BATCH_WINDOW = 0.015  # seconds
+
+_query_queue: Optional[asyncio.Queue] = None
+_batcher_task: Optional[asyncio.Task] = None
+
+# Popular questions repeat across users; cache their top-k documents for a
+# few minutes so hits skip both the Ollama embedding call and the Redis KNN.
+# Only accessed from the event loop, so no locking is needed.
+RETRIEVAL_CACHE_TTL = 300  # seconds
+_retrieval_cache: TTLCache = TTLCache(maxsize=4096, ttl=RETRIEVAL_CACHE_TTL)
+
+# Last-seen value of CACHE_GENERATION_KEY for this worker process
+_cache_generation: Optional[bytes] = None
+
+def _knn_search(vector: List[float], k: int = 3) -> List[LangChainDocument]:
+    """Runs a KNN query against the INT8 index, quantizing the query vector."""
+    blob, _ = quantize_vector(vector)
+    res = redis_client.execute_command(
+        "FT.SEARCH", INDEX_NAME,
+        f"*=>[KNN {k} @embedding $vec AS score]",
+        "PARAMS", "2", "vec", blob,
+        "SORTBY", "score",
+        "RETURN", "1", "text",
+        "DIALECT", "2",
+    )
+    # Reply layout: [count, key1, [field, value, ...], key2, ...]
+    docs = []
+    for fields in res[2::2]:
+        values = dict(zip(fields[::2], fields[1::2]))
+        text = values.get(b"text", b"").decode("utf-8", errors="replace")
+        docs.append(LangChainDocument(page_content=text))
+    return docs
+
+def _search_batch(vectors: List[List[float]]) -> List[List[LangChainDocument]]:
+    return [_knn_search(vector) for vector in vectors]
+
+async def _query_batcher():
+    """
+    Drains the query queue in small batches so concurrent chat requests
+    share a single embed_documents call instead of one embedding round-trip
+    to Ollama per request.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _query_queue.get()]
+        deadline = loop.time() + QUERY_BATCH_WINDOW
+        while len(batch) < QUERY_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_query_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            queries = [query for query, _ in batch]
+            vectors = await asyncio.to_thread(embeddings.embed_documents, queries)
+            results = await asyncio.to_thread(_search_batch, vectors)
+            for (_, future), docs in zip(batch, results):
+                if not future.done():
+                    future.set_result(docs)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+async def retrieve_documents(query: str) -> List[LangChainDocument]:
+    """Queues a query for the batcher and awaits its top-k documents."""
+    global _query_queue, _batcher_task, _cache_generation
+
+    # Cross-worker invalidation: clear-all bumps a generation counter in
+    # Redis, and each worker drops its local cache when the counter moves.
+    generation = await asyncio.to_thread(redis_client.get, CACHE_GENERATION_KEY)
+    if generation != _cache_generation:
+        _retrieval_cache.clear()
+        _cache_generation = generation
+
+    cache_key = query.lower().strip()
+    cached = _retrieval_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if _batcher_task is None:
+        _query_queue = asyncio.Queue()
+        _batcher_task = asyncio.create_task(_query_batcher())
+    future = asyncio.get_running_loop().create_future()
+    await _query_queue.put((query, future))
+    docs = await future
+    _retrieval_cache[cache_key] = docs
+    return docs
+
+# Returned without invoking the LLM when retrieval finds nothing
+CANNED_NO_CONTEXT_MSG = (
+    "I couldn't find anything in the knowledge base related to your question."
+    "\n\n💡 **Need more help?** Contact our customer service team for personalized assistance."
+)
 
 # --- FastAPI Endpoints (from ChatbotController.java) ---
 
@@ -157,36 +439,33 @@ async def chat(request: ChatRequest, services = Depends(get_services)):
     """
     Main chatbot endpoint. Processes a user query using RAG.
     """
-    vectorstore, chat_model, _ = services
     logger.info(f"Processing chat query for user: {request.user_id}")
 
     try:
-        # Step 1: Retrieve relevant documents
-        retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
-        relevant_docs = retriever.invoke(request.message)
+        # Step 1: Retrieve relevant documents via the shared query batcher
+        relevant_docs = await retrieve_documents(request.message)
+
+        # Out-of-corpus query: skip the LLM entirely and suggest a ticket
+        if not relevant_docs:
+            return ChatResponse(
+                response=CANNED_NO_CONTEXT_MSG,
+                user_id=request.user_id,
+                confidence_score=0.2,
+                suggest_ticket=True
+            )
 
         # Step 2: Prepare context
         doc_texts = [doc.page_content for doc in relevant_docs]
         documents_context = "\n---\n".join(doc_texts)
-        if not documents_context:
-            documents_context = "No specific context available."
-            
-        # Step 3: Prepare prompt and chain
-        prompt_template = ChatPromptTemplate.from_messages([
-            ("system", SYSTEM_PROMPT),
-            ("human", "{query}")
-        ])
-        
-        chain = prompt_template | chat_model | StrOutputParser()
-        
-        # Step 4: Invoke chain
-        response_text = chain.invoke({
+
+        # Step 3: Invoke the prebuilt chain
+        response_text = await chain.ainvoke({
             "documents": documents_context,
             "query": request.message
         })
-        
-        # Step 5: Confidence scoring and ticket suggestion
-        confidence_score = 0.2 if not relevant_docs else min(1.0, 0.5 + (len(relevant_docs) / 3.0 * 0.5))
+
+        # Step 4: Confidence scoring and ticket suggestion
+        confidence_score = min(1.0, 0.5 + (len(relevant_docs) / 3.0 * 0.5))
         suggest_ticket = confidence_score < 0.5
 
         if suggest_ticket:
@@ -204,6 +483,44 @@ async def chat(request: ChatRequest, services = Depends(get_services)):
         raise HTTPException(status_code=500, detail="Internal server error occurred.")
 
 
+@app.post("/api/v1/chatbot/chat/stream")
+async def chat_stream(request: ChatRequest, services = Depends(get_services)):
+    """
+    Streaming variant of the chat endpoint. Yields LLM tokens as
+    Server-Sent Events so the UI can render the answer as it is generated
+    instead of waiting for the full response.
+    """
+    logger.info(f"Processing streaming chat query for user: {request.user_id}")
+
+    try:
+        # Step 1: Retrieve relevant documents via the shared query batcher
+        relevant_docs = await retrieve_documents(request.message)
+
+        # Step 2: Prepare context
+        doc_texts = [doc.page_content for doc in relevant_docs]
+        documents_context = "\n---\n".join(doc_texts)
+
+    except Exception as e:
+        logger.error(f"Error preparing streaming chat: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error occurred.")
+
+    # Out-of-corpus query: stream the canned answer without invoking the LLM
+    if not relevant_docs:
+        async def canned_gen():
+            yield f"data: {json.dumps(CANNED_NO_CONTEXT_MSG)}\n\n"
+        return StreamingResponse(canned_gen(), media_type="text/event-stream")
+
+    async def token_gen():
+        # Tokens are JSON-encoded so newlines inside a token survive SSE framing
+        async for chunk in chain.astream({
+            "documents": documents_context,
+            "query": request.message
+        }):
+            yield f"data: {json.dumps(chunk)}\n\n"
+
+    return StreamingResponse(token_gen(), media_type="text/event-stream")
+
+
 @app.post("/api/v1/chatbot/documents/upload-multiple", response_model=UploadResponse)
 async def upload_multiple_documents(
     files: List[UploadFile] = File(...),
@@ -213,7 +530,6 @@ async def upload_multiple_documents(
     """
     Uploads multiple documents, processes them, and adds them to the vector store.
     """
-    vectorstore, _, _ = services
     logger.info(f"Processing {len(files)} files for user: {user_id}")
 
     if not files:
@@ -222,57 +538,50 @@ async def upload_multiple_documents(
     total_chunks = 0
     docs_processed = 0
     all_langchain_docs = []
-    
-    parsers = {
-        "application/pdf": parse_pdf,
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": parse_docx, # .docx
-        "application/msword": parse_docx, # .doc
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": parse_xlsx, # .xlsx
-        "application/vnd.ms-excel": parse_xlsx # .xls
-    }
 
+    supported_files = []
     for file in files:
-        if file.content_type not in parsers:
+        if file.content_type not in PARSERS:
             logger.warning(f"Skipping unsupported file type: {file.filename} ({file.content_type})")
             continue
-        
-        try:
-            contents = await file.read()
-            parser = parsers[file.content_type]
-            
-            # 1. Extract text
-            extracted_text = parser(contents)
-            if not extracted_text or extracted_text.isspace():
-                logger.warning(f"No text extracted from file: {file.filename}")
-                continue
-
-            # 2. Split text into chunks
-            chunks = text_splitter.split_text(extracted_text)
-            
-            # 3. Create LangChain Documents with metadata
-            for i, chunk in enumerate(chunks):
-                metadata = {
-                    "fileName": file.filename,
-                    "fileType": file.content_type,
-                    "userId": user_id,
-                    "chunkIndex": i,
-                    "totalChunks": len(chunks),
-                    "category": "financial_literacy",
-                    "uploadTimestamp": datetime.datetime.now().isoformat()
-                }
-                all_langchain_docs.append(LangChainDocument(page_content=chunk, metadata=metadata))
-            
-            total_chunks += len(chunks)
-            docs_processed += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to process file {file.filename}: {e}", exc_info=True)
+        supported_files.append(file)
+
+    # Parse files concurrently in worker threads; the semaphore bounds how
+    # many parsers run at once so a large batch doesn't exhaust the pool.
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def run_one(file: UploadFile) -> List[LangChainDocument]:
+        async with semaphore:
+            # Hand the parsers the spooled temp file instead of copying the
+            # whole upload into memory with await file.read().
+            file.file.seek(0)
+            return await asyncio.to_thread(
+                process_file, file.file, file.filename, file.content_type, user_id
+            )
+
+    results = await asyncio.gather(
+        *[run_one(file) for file in supported_files], return_exceptions=True
+    )
+
+    for file, result in zip(supported_files, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to process file {file.filename}: {result}", exc_info=result)
             raise HTTPException(status_code=500, detail=f"Error processing file: {file.filename}")
+        if not result:
+            continue
+        all_langchain_docs.extend(result)
+        total_chunks += len(result)
+        docs_processed += 1
 
     # 4. Add all documents to vector store
     if all_langchain_docs:
         try:
-            vectorstore.add_documents(all_langchain_docs)
+            # Blocking Ollama/Redis calls, so run off the event loop
+            await asyncio.to_thread(add_documents_batched, all_langchain_docs)
+            # New documents make cached retrievals stale (including cached
+            # empty results that short-circuit to the canned no-context
+            # answer), so tell every worker to drop its cache
+            await asyncio.to_thread(redis_client.incr, CACHE_GENERATION_KEY)
             logger.info(f"Successfully added {total_chunks} chunks from {docs_processed} documents to Redis.")
         except Exception as e:
             logger.error(f"Failed to add documents to vector store: {e}", exc_info=True)
@@ -292,18 +601,29 @@ async def clear_all_documents(admin_key: str, services = Depends(get_services)):
     Clears all documents from the vector store.
     Matches the 'admin123' key from ChatbotController.java.
     """
-    _, _, redis_client = services
-    
+    _, redis_client = services
+
     if admin_key != "admin123":
         raise HTTPException(status_code=403, detail="Unauthorized")
-    
+
     try:
-        redis_client.flushdb()
+        # Drop the index together with its documents (DD). Unlike FLUSHDB
+        # this is scoped to the index's own keys and doesn't stall Redis
+        # for unrelated data.
+        try:
+            redis_client.execute_command("FT.DROPINDEX", INDEX_NAME, "DD")
+        except redis.exceptions.ResponseError:
+            # Index doesn't exist yet; nothing to drop
+            pass
         logger.info("Successfully cleared all documents from Redis.")
-        
-        # Re-initialize the index schema after clearing
-        vectorstore.schema = Redis.check_index_schema(redis_url=REDIS_URL, index_name=INDEX_NAME, embeddings=embeddings)
-        
+
+        # Re-create the index so it is ready for new uploads, and bump the
+        # generation counter so every worker drops cached retrievals that
+        # point at the deleted documents
+        ensure_vector_index()
+        redis_client.incr(CACHE_GENERATION_KEY)
+        _retrieval_cache.clear()
+
         return ClearResponse(
             success=True,
             message="All documents cleared successfully. The index is ready for new uploads."
@@ -325,5 +645,16 @@ async def health_check():
     )
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # One worker per core with the uvloop event loop and httptools HTTP
+    # parser; multi-worker mode needs the app as an import string. Each
+    # worker process imports this module and so builds its own Ollama and
+    # Redis clients.
+    uvicorn.run(
+        "backend:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools"
+    )
 
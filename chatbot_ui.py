@@ -1,11 +1,21 @@
 import streamlit as st
-import requests
-import time
+import httpx
+import json
 
 # --- Configuration ---
 st.set_page_config(layout="centered", page_title="FinLit Chatbot")
 BACKEND_URL = "http://localhost:8000"  # URL of your FastAPI backend
 
+# --- Shared HTTP Client ---
+# Cached across Streamlit reruns so every chat turn reuses a pooled
+# keep-alive connection to the backend instead of opening a fresh one.
+@st.cache_resource
+def get_http():
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        timeout=60
+    )
+
 # --- Page Title ---
 st.title("💸 Financial Literacy Chatbot")
 st.caption("Ask me anything about your financial documents!")
@@ -34,38 +44,36 @@ if prompt := st.chat_input("Ask a question about budgeting, saving, etc."):
         message_placeholder.markdown("Thinking...")
         
         try:
-            # Call the FastAPI backend's /chat endpoint
+            # Call the FastAPI backend's streaming /chat/stream endpoint
             api_request_data = {
                 "message": prompt,
-                "user_id": "streamlit_user_123" 
+                "user_id": "streamlit_user_123"
             }
-            
-            response = requests.post(
-                f"{BACKEND_URL}/api/v1/chatbot/chat",
-                json=api_request_data,
-                timeout=60 # 60-second timeout
-            )
-            
-            if response.status_code == 200:
-                bot_response = response.json()
-                response_text = bot_response.get("response", "Sorry, I couldn't get a response.")
-                
-                # Simulate typing effect
-                full_response = ""
-                for chunk in response_text.split():
-                    full_response += chunk + " "
-                    time.sleep(0.05)
-                    message_placeholder.markdown(full_response + "▌")
-                message_placeholder.markdown(full_response)
-                
-                # Add bot response to history
-                st.session_state.messages.append({"role": "assistant", "content": response_text})
-                
-            else:
-                error_detail = response.json().get('detail', 'Unknown server error')
-                st.error(f"Failed to get response from bot: {error_detail}")
-                st.session_state.messages.append({"role": "assistant", "content": f"Sorry, I ran into an error: {error_detail}"})
 
-        except requests.exceptions.RequestException as e:
+            with get_http().stream(
+                "POST",
+                f"{BACKEND_URL}/api/v1/chatbot/chat/stream",
+                json=api_request_data
+            ) as response:
+                if response.status_code == 200:
+                    # Render real LLM tokens as they arrive over SSE
+                    full_response = ""
+                    for line in response.iter_lines():
+                        if not line or not line.startswith("data: "):
+                            continue
+                        full_response += json.loads(line[len("data: "):])
+                        message_placeholder.markdown(full_response + "▌")
+                    message_placeholder.markdown(full_response)
+
+                    # Add bot response to history
+                    st.session_state.messages.append({"role": "assistant", "content": full_response})
+
+                else:
+                    response.read()  # streamed bodies must be read before .json()
+                    error_detail = response.json().get('detail', 'Unknown server error')
+                    st.error(f"Failed to get response from bot: {error_detail}")
+                    st.session_state.messages.append({"role": "assistant", "content": f"Sorry, I ran into an error: {error_detail}"})
+
+        except httpx.HTTPError as e:
             st.error(f"Connection error: {e}")
             st.session_state.messages.append({"role": "assistant", "content": f"Sorry, I couldn't connect to the server: {e}"})